@@ -0,0 +1,139 @@
+'''
+Colormap lookup for radar field rasters, compiled with Numba when it is installed.
+
+setup.py compiles the kernel ahead of time into armor_tools._colormap_aot when
+Numba is available at build time; otherwise it is JIT-compiled on first use.
+'''
+import numpy as np
+
+
+def build_lut(cmap, n=256):
+    """
+    Bake a Colormap into an RGBA lookup table.
+
+    Parameters
+    ----------
+    cmap : matplotlib.colors.Colormap
+        Colormap to sample.
+    n : int, optional
+        Number of colors sampled evenly from the colormap. Defaults to 256.
+
+    Returns
+    -------
+    lut : ndarray of uint8, shape (n + 1, 4)
+        The sampled colors, plus a final entry holding the colormap's "bad"
+        color (transparent by default) used for masked gates.
+    """
+    lut = np.empty((n + 1, 4), dtype=np.uint8)
+    lut[:n] = cmap(np.linspace(0.0, 1.0, n), bytes=True)
+    lut[n] = cmap(np.ma.masked_invalid([np.nan]), bytes=True)[0]
+    return lut
+
+
+def _lookup_loop(data, vmin, vmax, lut, out):
+    # the last LUT entry is reserved for NaN (masked) gates
+    n = lut.shape[0] - 1
+    # vmin == vmax maps every value to the first color, as Normalize does
+    scale = n / (vmax - vmin) if vmax != vmin else 0.0
+    nrows, ncols = data.shape
+    for i in range(nrows):
+        for j in range(ncols):
+            v = data[i, j]
+            if v != v:
+                k = n
+            else:
+                # clip in floating point first so inf never reaches int();
+                # 'not f > 0' also catches the NaN from inf * 0
+                f = (v - vmin) * scale
+                if not f > 0.0:
+                    k = 0
+                elif f >= n:
+                    k = n - 1
+                else:
+                    k = int(f)
+            for c in range(4):
+                out[i, j, c] = lut[k, c]
+    return out
+
+
+def _lookup_numpy(data, vmin, vmax, lut, out):
+    n = lut.shape[0] - 1
+    data = np.asarray(data, dtype=np.float64)
+    if vmax == vmin:
+        idx = np.zeros(data.shape)
+    else:
+        with np.errstate(invalid='ignore'):
+            idx = np.clip((data - vmin) * (n / (vmax - vmin)), 0, n - 1)
+    idx = np.where(np.isnan(data), n, idx).astype(np.intp)
+    np.take(lut, idx, axis=0, out=out)
+    return out
+
+
+# Signature of the ahead-of-time compiled kernel: float32 data, float64 limits
+_AOT_SIGNATURE = 'u1[:,:,:](f4[:,:], f8, f8, u1[:,:], u1[:,:,:])'
+
+
+def aot_compiler():
+    """
+    Return a numba.pycc.CC that builds the lookup kernel as the extension
+    module armor_tools._colormap_aot. Used by setup.py.
+    """
+    from numba.pycc import CC
+
+    cc = CC('_colormap_aot')
+    cc.export('rescale_and_lookup_f32', _AOT_SIGNATURE)(_lookup_loop)
+    return cc
+
+
+def _select_kernel():
+    # prefer the prebuilt extension (no JIT warmup, numba not even imported),
+    # then numba's JIT, then plain numpy
+    try:
+        from ._colormap_aot import rescale_and_lookup_f32
+        return rescale_and_lookup_f32
+    except ImportError:
+        pass
+    try:
+        import numba
+    except ImportError:
+        return _lookup_numpy
+    # nogil so sweeps rendered in a thread pool color their fields concurrently
+    return numba.njit(cache=True, nogil=True)(_lookup_loop)
+
+
+# chosen on first use, so importing this module doesn't import numba
+_lookup = None
+
+
+def rescale_and_lookup(data, vmin, vmax, lut, out=None):
+    """
+    Map a 2-D field onto RGBA colors, as Normalize(vmin, vmax) followed by the
+    colormap would.
+
+    Values below vmin or above vmax take the first or last color, and every
+    value takes the first color if vmin == vmax. NaN gates take the final
+    "bad" entry of ``lut``.
+
+    Parameters
+    ----------
+    data : ndarray, shape (nrays, ngates)
+        Field values, with NaN at masked gates. Converted to float32 if needed.
+    vmin, vmax : float
+        Data range mapped onto the colormap.
+    lut : ndarray of uint8, shape (n + 1, 4)
+        Lookup table from build_lut.
+    out : ndarray of uint8, shape (nrays, ngates, 4), optional
+        Output buffer. A new one is allocated if None.
+
+    Returns
+    -------
+    out : ndarray of uint8, shape (nrays, ngates, 4)
+        RGBA image, ready to pass to pcolormesh.
+    """
+    global _lookup
+    if _lookup is None:
+        _lookup = _select_kernel()
+    if out is None:
+        out = np.empty(data.shape + (4,), dtype=np.uint8)
+    data = np.asarray(data, dtype=np.float32)
+    return _lookup(data, float(vmin), float(vmax), lut, out)
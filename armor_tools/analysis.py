@@ -1,16 +1,46 @@
 '''
 The purpose of this Python file is to serve as a place for all data analysis functions to live.
 '''
-import pyart
 import lzma
 import gzip
+import errno
+import io
+import math
+import mmap
+import functools
+import contextlib
+import shutil
+import tempfile
 from pathlib import Path
 import os
 import numpy as np
-import xarray as xr
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from typing import List
 
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+# Chunk size used when streaming decompressed data to disk
+READ_BUFFER_SIZE = 1 << 20
+# Buffer size for the output file so writes are batched
+WRITE_BUFFER_SIZE = 1 << 20
+# Number of decompressed bytes read when only the file header is needed
+HEADER_READ_SIZE = 4 * 1024 * 1024
+# RAM-backed directory for temporary decompressed files, if the system has one
+_MEMORY_TMP_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Beam height constants: 4/3 effective Earth radius (meters), assumes standard refraction
+_KAE = (4.0 / 3.0) * 6371000.0
+_KAE2 = _KAE * _KAE
+_TWO_KAE = 2.0 * _KAE
+_DEG2RAD = math.pi / 180.0
+_RAD2DEG = 180.0 / math.pi
+# Arrays larger than this are evaluated in one fused pass with numexpr, if installed
+_NUMEXPR_MIN_SIZE = 1024
+
 def decompress_xz(input_file, output_file=None):
     """
     Decompress a .xz-compressed CfRadial NetCDF file to disk.
@@ -31,15 +61,18 @@ def decompress_xz(input_file, output_file=None):
     input_file = Path(input_file)
 
     if output_file is None:
-        # strip `.xz` and replace with `.nc`
-        output_file = input_file.with_suffix("")
-        if output_file.suffix != ".nc":
-            output_file = output_file.with_suffix(".nc")
-
-    output_file = Path(output_file)
+        # strip `.xz` and replace with `.nc`, building only one new Path
+        name = input_file.stem
+        if not name.endswith(".nc"):
+            name = os.path.splitext(name)[0] + ".nc"
+        output_file = input_file.with_name(name)
+    else:
+        output_file = Path(output_file)
 
-    with lzma.open(input_file, "rb") as f_in, open(output_file, "wb") as f_out:
-        f_out.write(f_in.read())
+    # stream in 1 MiB chunks; the large read buffer cuts Python/C round trips
+    with io.BufferedReader(lzma.LZMAFile(input_file, "rb"), buffer_size=READ_BUFFER_SIZE) as f_in, \
+            open(output_file, "wb", buffering=WRITE_BUFFER_SIZE) as f_out:
+        shutil.copyfileobj(f_in, f_out, length=READ_BUFFER_SIZE)
 
     return output_file
 
@@ -63,15 +96,19 @@ def decompress_gz(input_file, output_file=None):
     input_file = Path(input_file)
 
     if output_file is None:
-        # strip `.gz` and replace with `.nc`
-        output_file = input_file.with_suffix("")
-        if output_file.suffix != ".nc":
-            output_file = output_file.with_suffix(".nc")
-
-    output_file = Path(output_file)
+        # strip `.gz` and replace with `.nc`, building only one new Path
+        name = input_file.stem
+        if not name.endswith(".nc"):
+            name = os.path.splitext(name)[0] + ".nc"
+        output_file = input_file.with_name(name)
+    else:
+        output_file = Path(output_file)
 
-    with gzip.open(input_file, "rb") as f_in, open(output_file, "wb") as f_out:
-        f_out.write(f_in.read())
+    # stream in 1 MiB chunks; the large read buffer cuts Python/C round trips
+    with open(input_file, "rb") as f_raw, \
+            io.BufferedReader(gzip.GzipFile(fileobj=f_raw, mode="rb"), buffer_size=READ_BUFFER_SIZE) as f_in, \
+            open(output_file, "wb", buffering=WRITE_BUFFER_SIZE) as f_out:
+        shutil.copyfileobj(f_in, f_out, length=READ_BUFFER_SIZE)
 
     return output_file
 
@@ -90,18 +127,164 @@ def remove_nc(file_path):
     bool
         True if the file was removed, False if it didn't exist.
     """
-    file_path = Path(file_path)
+    # only remove .nc files; unlink directly instead of checking exists() first
+    if not os.fspath(file_path).endswith(".nc"):
+        return False
 
-    if file_path.exists() and file_path.suffix == ".nc":
-        os.remove(file_path)
-        return True
-    else:
+    try:
+        os.unlink(file_path)
+    except FileNotFoundError:
         return False
+    return True
+
+def read_xz_to_radar(input_file, tmp_dir=None, **kwargs):
+    """
+    Read a .xz-compressed CfRadial file into a Py-ART radar object.
+
+    Py-ART can only open radar files by name, so the archive is decompressed
+    to a temporary file, which is removed once it has been read. By default
+    the file goes to a RAM-backed directory (``/dev/shm`` when available),
+    falling back to the regular temporary directory if it doesn't fit there.
+
+    Parameters
+    ----------
+    input_file : str or Path
+        Path to the .xz file.
+    tmp_dir : str or Path, optional
+        Directory for the temporary decompressed file. If None, uses
+        ``/dev/shm`` and then ``tempfile.gettempdir()`` as described above.
+    **kwargs
+        Passed on to ``pyart.io.read``. ``delay_field_loading`` must stay
+        False since the temporary file is gone once this returns.
+
+    Returns
+    -------
+    pyart.core.Radar
+        Radar object read from the decompressed file.
+    """
+    import pyart
+    with _decompressed_xz(input_file, tmp_dir) as f_nc:
+        return pyart.io.read(f_nc, **kwargs)
+
+
+@contextlib.contextmanager
+def _decompressed_xz(input_file, tmp_dir=None):
+    """
+    Decompress a .xz file to a temporary .nc file, yield its path, and remove
+    it afterwards.
+
+    Uses ``tmp_dir`` if given. Otherwise uses ``/dev/shm`` when available,
+    retrying in ``tempfile.gettempdir()`` if the file doesn't fit there.
+    """
+    if tmp_dir is not None:
+        tmp_dirs = [tmp_dir]
+    elif _MEMORY_TMP_DIR is not None:
+        # None means tempfile.gettempdir(), tried if the file fills /dev/shm
+        tmp_dirs = [_MEMORY_TMP_DIR, None]
+    else:
+        tmp_dirs = [None]
+
+    for i, directory in enumerate(tmp_dirs):
+        fd, f_nc = tempfile.mkstemp(suffix=".nc", dir=directory)
+        os.close(fd)
+        try:
+            decompress_xz(input_file, output_file=f_nc)
+        except BaseException as e:
+            remove_nc(f_nc)
+            if isinstance(e, OSError) and e.errno == errno.ENOSPC and i < len(tmp_dirs) - 1:
+                continue
+            raise
+        try:
+            yield f_nc
+        finally:
+            remove_nc(f_nc)
+        return
+
+def read_nc_pyart_mmap(nc_filepath, **kwargs):
+    """
+    Read a decompressed .nc file with Py-ART after prefetching it via mmap.
+
+    Py-ART only opens radar files by name, so the file can't be handed over
+    as an in-memory buffer. Instead the file is memory-mapped and the kernel
+    is told (``madvise``) to read it ahead sequentially. Py-ART's reads then
+    come from the page cache. If the file can't be mapped (empty file, no
+    ``madvise`` on this platform) it's read normally.
+
+    Parameters
+    ----------
+    nc_filepath : str or Path
+        Path to the .nc file to read.
+    **kwargs
+        Passed on to ``pyart.io.read``.
+
+    Returns
+    -------
+    pyart.core.Radar
+        Radar object read from the file.
+    """
+    import pyart
+    nc_filepath = os.fspath(nc_filepath)
+
+    if hasattr(mmap.mmap, "madvise"):
+        fd = os.open(nc_filepath, os.O_RDONLY)
+        try:
+            with mmap.mmap(fd, 0, prot=mmap.PROT_READ) as buf:
+                buf.madvise(mmap.MADV_SEQUENTIAL)
+                buf.madvise(mmap.MADV_WILLNEED)
+        except (OSError, ValueError):
+            pass
+        finally:
+            os.close(fd)
+
+    return pyart.io.read(nc_filepath, **kwargs)
+
+@functools.lru_cache(maxsize=8)
+def _cached_read(path, mtime):
+    import pyart
+    # mtime is only part of the cache key, so a rewritten file is re-read
+    if path.endswith(".xz"):
+        return read_xz_to_radar(path)
+    return pyart.io.read(path)
+
+def read_radar_cached(input_file):
+    """
+    Read a radar file with Py-ART, reusing the radar object from earlier calls.
+
+    Up to 8 radar objects are kept, keyed on file path and modification time.
+    `.xz` files are decompressed with read_xz_to_radar.
+
+    The same object is returned on every hit, so in-place changes (e.g. from
+    correct_elevation_pointing_angle or noise_filter) are seen by later callers.
+    Use pyart.io.read or read_xz_to_radar when a fresh copy is needed.
+
+    Parameters
+    ----------
+    input_file : str or Path
+        Path to the radar file (.nc, .xz or any Py-ART-readable format).
+
+    Returns
+    -------
+    pyart.core.Radar
+        Radar object read from the file.
+    """
+    input_file = os.fspath(input_file)
+    return _cached_read(input_file, os.path.getmtime(input_file))
+
+@functools.lru_cache(maxsize=256)
+def _list_fields_cached(nc_filepath, mtime):
+    import xarray as xr
+    # mtime is only part of the cache key, so a rewritten file is re-read
+    with xr.open_dataset(nc_filepath, engine="netcdf4", decode_times=False, decode_timedelta=False,
+                         mask_and_scale=False, cache=False) as ds:
+        return tuple(ds.keys())
 
 def list_fields(nc_filepath):
     """
         Lists fields contained in a netCDF ARMOR file
 
+        Only the file metadata is read, and results are cached per file path
+        and modification time.
+
         Parameters
         ----------
         nc_filepath : str or Path
@@ -112,11 +295,10 @@ def list_fields(nc_filepath):
         list
             List contaning field names
         """
-    ds = xr.open_dataset(nc_filepath)
-    vars = list(ds.keys())
-    return vars
+    nc_filepath = os.fspath(nc_filepath)
+    return list(_list_fields_cached(nc_filepath, os.path.getmtime(nc_filepath)))
 
-def L2_to_CFRad(L2_filename, save_path):
+def L2_to_CFRad(L2_filename, save_path, format="NETCDF4"):
     """
     Convert a NEXRAD Level II radar file to CfRadial format.
 
@@ -133,48 +315,71 @@ def L2_to_CFRad(L2_filename, save_path):
     save_path : str or Path
         Directory where the converted CfRadial file will be written.
 
+    format : str, optional
+        NetCDF format passed to pyart.io.write_cfradial. The default,
+        "NETCDF4", gets Py-ART's per-variable zlib compression. Classic formats
+        such as "NETCDF3_64BIT" have no compression; they read back faster but
+        are much slower to write and far larger on disk, since Py-ART's
+        unlimited time dimension makes every field a record variable.
+
     Returns
     -------
     str
         Full path to the output CfRadial `.nc` file.
     """
+    import pyart
     #strips the name of the file
     base = os.path.splitext(os.path.basename(L2_filename))[0]
     #adds the name to the save_path
     out_path = os.path.join(save_path, f"{base}.nc")
     #reads in the L2 file with pyart and converts it
     radar = pyart.io.read_nexrad_archive(L2_filename)
-    pyart.io.write_cfradial(out_path, radar)
+    pyart.io.write_cfradial(out_path, radar, format=format, arm_time_variables=False)
 
     return out_path
 
+def _use_numexpr(*args):
+    """
+    Return True if numexpr is available and worth using for these arguments.
+
+    Masked arrays are left to NumPy since numexpr would drop the mask.
+    """
+    if ne is None or any(isinstance(a, np.ma.MaskedArray) for a in args):
+        return False
+    return any(isinstance(a, np.ndarray) and a.size > _NUMEXPR_MIN_SIZE for a in args)
+
 def cal_beam_height(rng, elev_angle):
     """
     Function to calculate the beam height of a radar
 
     Parameters
     ----------
-    rng : int or float
+    rng : int, float or ndarray
         range to a radar gate in meters
 
-    elev_angle : int or float
+    elev_angle : int, float or ndarray
         elevation angle for a radar gate in degrees
 
     Returns
     -------
-    float
+    float or ndarray
         height of range gate in meters
     """
 
-    # Constants
-    A_E = 6371000 # Avg. Earth Radius (meters)
-    K = 4/3 # Refraction Term, assumes standard refraction of 4/3 ae
+    # Scalar inputs skip NumPy ufunc dispatch
+    if isinstance(rng, (int, float)) and isinstance(elev_angle, (int, float)):
+        return math.sqrt(rng * rng + _KAE2 + _TWO_KAE * rng * math.sin(elev_angle * _DEG2RAD)) - _KAE
 
     # Converting elev_angle to radians
-    rad_angle = elev_angle * (np.pi/180)
+    rad_angle = elev_angle * _DEG2RAD
+
+    # Large arrays: single pass with no temporaries
+    if _use_numexpr(rng, elev_angle):
+        return ne.evaluate("sqrt(rng*rng + KAE2 + TWO_KAE*rng*sin(rad)) - KAE",
+                           local_dict={"rng": rng, "rad": rad_angle, "KAE": _KAE, "KAE2": _KAE2, "TWO_KAE": _TWO_KAE})
 
     # Calculating Beam Height Above Radar Level
-    z_arl = np.sqrt(rng**2 + (K*A_E)**2 + 2*rng*K*A_E*np.sin(rad_angle)) - K*A_E
+    z_arl = np.sqrt(rng**2 + _KAE2 + _TWO_KAE * rng * np.sin(rad_angle)) - _KAE
 
     return z_arl
 
@@ -184,36 +389,108 @@ def cal_elev_angle(rng, z_arl):
 
     Parameters
     ----------
-    rng : int or float
+    rng : int, float or ndarray
         range to a radar gate in meters
 
-    z_arl : int or float
+    z_arl : int, float or ndarray
         height above radar level for a radar gate in meters
 
     Returns
     -------
-    float
+    float or ndarray
         elevation angle for range gate in degrees
     """
 
-    # Constants
-    A_E = 6371000  # Avg. Earth Radius (meters)
-    K = 4 / 3  # Refraction Term, assumes standard refraction of 4/3 ae
+    # Scalar inputs skip NumPy ufunc dispatch. Out-of-domain values fall through
+    # to the NumPy expression so they give nan; a scalar rng == 0 still raises
+    # ZeroDivisionError there, as it always has
+    if isinstance(rng, (int, float)) and isinstance(z_arl, (int, float)) and rng != 0:
+        x = ((z_arl + _KAE) ** 2 - _KAE2 - rng * rng) / (_TWO_KAE * rng)
+        if -1.0 <= x <= 1.0:
+            return math.asin(x) * _RAD2DEG
+
+    # Large arrays: single pass with no temporaries
+    if _use_numexpr(rng, z_arl):
+        return ne.evaluate("arcsin(((z + KAE)**2 - KAE2 - rng*rng) / (TWO_KAE*rng)) * RAD2DEG",
+                           local_dict={"rng": rng, "z": z_arl, "KAE": _KAE, "KAE2": _KAE2, "TWO_KAE": _TWO_KAE,
+                                       "RAD2DEG": _RAD2DEG})
 
     # Solving for elevation angle in radians
-    rad_angle = np.arcsin(((z_arl + K * A_E) ** 2 - (K * A_E) ** 2 - rng ** 2) / (2 * rng * K * A_E))
+    rad_angle = np.arcsin(((z_arl + _KAE) ** 2 - _KAE2 - rng ** 2) / (_TWO_KAE * rng))
 
     # Converting elevation angle to degrees
-    elev_angle = rad_angle * (180/np.pi)
+    elev_angle = rad_angle * _RAD2DEG
 
     return elev_angle
 
 
-def filter_folder_vcp(file_folder, vcp_min, vcp_max):
+def _read_vcp(ds):
+    """
+    Read the VCP value from an open netCDF4 Dataset.
+
+    Handles ``vcp_pattern`` stored either as a variable or as a global attribute.
+    """
+    if "vcp_pattern" in ds.variables:
+        return int(ds.variables["vcp_pattern"][...])
+    return int(ds.getncattr("vcp_pattern"))
+
+
+def _vcp_for_file(path):
+    """
+    Read the VCP value of a single .xz CfRadial file.
+
+    For classic-format (``CDF``) files only the first HEADER_READ_SIZE bytes
+    are decompressed, in memory, which is usually enough to reach
+    ``vcp_pattern``. netCDF4 can't open a truncated HDF5 (NETCDF4) buffer, so
+    those files, and classic files whose VCP lies past the partial read, are
+    streamed to a temporary file instead, as read_xz_to_radar does.
+
+    Top-level so it can be pickled and run in a worker process by
+    filter_folder_vcp.
+
+    Parameters
+    ----------
+    path : str or Path
+        Path to the .xz file.
+
+    Returns
+    -------
+    tuple of (str or Path, int)
+        The input path and its VCP value.
+    """
+    import netCDF4
+    with lzma.open(path, "rb") as fh:
+        data = fh.read(HEADER_READ_SIZE)
+
+    # a short read holds the whole file, which opens from memory in any format
+    if data.startswith(b"CDF") or len(data) < HEADER_READ_SIZE:
+        try:
+            with netCDF4.Dataset("inmemory.nc", mode="r", memory=data) as ds:
+                return path, _read_vcp(ds)
+        except (OSError, RuntimeError, KeyError, AttributeError, IndexError, ValueError):
+            # header (or vcp_pattern's data) lies beyond the partial read;
+            # netCDF4 raises RuntimeError when a variable's data is past the buffer
+            pass
+    del data
+
+    with _decompressed_xz(path) as f_nc:
+        with netCDF4.Dataset(f_nc, mode="r") as ds:
+            vcp = _read_vcp(ds)
+
+    return path, vcp
+
+
+def filter_folder_vcp(file_folder, vcp_min, vcp_max, max_workers=None):
     """
     Return a list of .xz CfRadial files whose VCP value falls within
     the interval [vcp_min, vcp_max). No files are deleted.
 
+    Files are decompressed and read in parallel worker processes. Under the
+    spawn or forkserver start methods (the default on macOS and Windows, and
+    on Linux from Python 3.14), a calling script must keep its top-level code
+    under ``if __name__ == "__main__":``. With one worker or one file,
+    everything runs in-process instead.
+
     Parameters
     ----------
     file_folder : str or Path
@@ -225,33 +502,41 @@ def filter_folder_vcp(file_folder, vcp_min, vcp_max):
     vcp_max : int
         Maximum VCP value to retain (exclusive).
 
+    max_workers : int, optional
+        Number of worker processes. Defaults to the number of CPUs. Never more
+        than the number of files.
+
     Returns
     -------
     list of Path
         Files whose VCP values fall within the specified range.
     """
-    file_path = Path(file_folder)
-    files = sorted(file_path.glob("*.xz"))
+    # scandir avoids building a Path object for every directory entry
+    with os.scandir(file_folder) as it:
+        files = [e.path for e in it if e.name.endswith(".xz") and e.is_file()]
     kept_files = []
+    if not files:
+        return kept_files
 
-    for f in files:
-        # decompress to temp .nc
-        f_nc = decompress_xz(f)
+    # no more workers than files, since each worker is started up front
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(files))
 
-        # read VCP
-        ds = xr.open_dataset(f_nc)
-        try:
-            vcp = int(ds.vcp_pattern)
-        finally:
-            ds.close()
+    if max_workers == 1:
+        # a single worker gains nothing from a pool, and needs no main guard in-process
+        results = list(map(_vcp_for_file, files))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_vcp_for_file, files, chunksize=4))
 
+    for f, vcp in results:
         # keep file if within range
         if vcp_min <= vcp < vcp_max:
-            kept_files.append(f)
-
-        # remove the temporary .nc
-        remove_nc(f_nc)
+            kept_files.append(Path(f))
 
+    # only the kept files need sorting
+    kept_files.sort()
     return kept_files
 
 
@@ -447,6 +732,7 @@ def noise_filter(radar, field_in, SNR=5, rho=0.6, vel_notch=None, vel_field='VEL
     -------
         radar: pyart radar object with "F{field}" field added
     '''
+    import pyart
 
     # applying thresholds to pyart gatefilter
     gatefilter = pyart.correct.GateFilter(radar)
@@ -603,28 +889,19 @@ def filter_files_vcp(files, vcp_min, vcp_max):
     list of Path
         Files whose VCP values fall within the specified range.
     """
+    import netCDF4
     kept_files = []
 
     for f in sorted(Path(f) for f in files):
         if f.suffix == '.nc':
-            f_nc = f
-            temp = False
+            with netCDF4.Dataset(f, "r") as ds:
+                vcp = _read_vcp(ds)
         else:
-            f_nc = decompress_xz(f)
-            temp = True
-
-        ds = xr.open_dataset(f_nc)
-        try:
-            vcp = int(ds.vcp_pattern)
-        finally:
-            ds.close()
+            _, vcp = _vcp_for_file(f)
 
         if vcp_min <= vcp < vcp_max:
             kept_files.append(f)
 
-        if temp:
-            remove_nc(f_nc)
-
     return kept_files
 
 
@@ -666,6 +943,7 @@ def dealias_velocity(radar,vel_field='VEL',texture_field='velocity_texture',outp
         - texture_field added
         - output_field added
     """
+    import pyart
 
     if vel_field not in radar.fields:
         raise KeyError(f"Field '{vel_field}' not found in radar.fields")
@@ -729,6 +1007,7 @@ def radar_to_nc(radar,original_file,output_dir,suffix=None,overwrite=True):
     Path
         Path to saved file.
     """
+    import pyart
 
     original_file = Path(original_file)
     output_dir = Path(output_dir)
@@ -102,15 +102,11 @@ files = xz_files + nc_only
 print(f'Found {len(files)} PPI file(s) in {INPUT_FOLDER}')
 
 for f in tqdm(files, desc='Plotting PPI files', unit='file'):
-    f_nc = None
     try:
         if f.suffix == '.xz':
-            f_nc = analysis.decompress_xz(f)
-            radar_path = f_nc
+            radar = analysis.read_xz_to_radar(f)
         else:
-            radar_path = f
-
-        radar = pyart.io.read(str(radar_path))
+            radar = pyart.io.read(str(f))
 
         # Date for top-level output subfolder
         units_str = radar.time['units']
@@ -137,8 +133,4 @@ for f in tqdm(files, desc='Plotting PPI files', unit='file'):
     except Exception as e:
         print(f'Error processing {f.name}: {e}')
 
-    finally:
-        if f_nc is not None:
-            analysis.remove_nc(f_nc)
-
 print('Done.')
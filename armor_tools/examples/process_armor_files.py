@@ -10,7 +10,6 @@ from armor_tools import analysis
 from datetime import datetime
 from tqdm import tqdm
 from pathlib import Path
-import pyart
 
 
 # USER DEFINED VARIABLES
@@ -76,13 +75,9 @@ print(f'Other/Unclassified Files: {len(other_files)}')
 
 # QC-ing RHI Files
 for f in tqdm(rhi_files, desc='QC-ing RHI Files', unit='file'):
-    f_nc = None
     try:
-        # decompressing file
-        f_nc = analysis.decompress_xz(f)
-
-        # reading in file
-        radar = pyart.io.read(f_nc)
+        # decompressing and reading in file
+        radar = analysis.read_xz_to_radar(f)
 
         # correcting pointing angle
         radar = analysis.correct_elevation_pointing_angle(radar, offset=el_offset)
@@ -111,20 +106,11 @@ for f in tqdm(rhi_files, desc='QC-ing RHI Files', unit='file'):
     except Exception as e:
         print(f'Error processing {f.name}: {e}')
 
-    finally:
-        # removing temp f_nc file
-        if f_nc is not None:
-            analysis.remove_nc(f_nc)
-
 for f in tqdm(ppi_files, desc='QC-ing PPI Files', unit='file'):
     # quality control functions
-    f_nc = None
     try:
-        # decompressing file
-        f_nc = analysis.decompress_xz(f)
-
-        # reading in file
-        radar = pyart.io.read(f_nc)
+        # decompressing and reading in file
+        radar = analysis.read_xz_to_radar(f)
 
         # correcting pointing angle
         radar = analysis.correct_azimuth_pointing_angle_ppi_dynamic(radar)
@@ -153,22 +139,13 @@ for f in tqdm(ppi_files, desc='QC-ing PPI Files', unit='file'):
     except Exception as e:
         print(f'Error processing {f.name}: {e}')
 
-    finally:
-        # removing temp f_nc file
-        if f_nc is not None:
-            analysis.remove_nc(f_nc)
-
 
 # QC-ing PPI Sector Files
 for f in tqdm(ppi_sector_files, desc='QC-ing PPI Sector Files', unit='file'):
     # quality control functions
-    f_nc = None
     try:
-        # decompressing file
-        f_nc = analysis.decompress_xz(f)
-
-        # reading in file
-        radar = pyart.io.read(f_nc)
+        # decompressing and reading in file
+        radar = analysis.read_xz_to_radar(f)
 
         # correcting pointing angle
         radar = analysis.correct_azimuth_pointing_angle_sector(radar, offset=az_offset_sector, verbose=False)
@@ -195,8 +172,3 @@ for f in tqdm(ppi_sector_files, desc='QC-ing PPI Sector Files', unit='file'):
 
     except Exception as e:
         print(f'Error processing {f.name}: {e}')
-
-    finally:
-        # removing temp f_nc file
-        if f_nc is not None:
-            analysis.remove_nc(f_nc)
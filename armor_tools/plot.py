@@ -1,12 +1,390 @@
-import matplotlib.pyplot as plt
-import pyart
+import os
+import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from datetime import datetime, timedelta
 import numpy as np
 from pathlib import Path
 
+from ._colormap_numba import build_lut, rescale_and_lookup
 
 
-def plot_rhi(radar, fields, xmin = 0, xmax = 60, ymin = 0, ymax = 12, save_path = None, grids = False):
+# Default plotting parameters for each field
+_FIELD_PARAMS_STATIC = {
+    # Reflectivity
+    'reflectivity': {'vmin': -10, 'vmax': 70, 'cmap': 'HomeyerRainbow', 'title': 'Reflectivity (dBZ)'},
+    'REF': {'vmin': -10, 'vmax': 70, 'cmap': 'HomeyerRainbow', 'title': 'Reflectivity (dBZ)'},
+    'FREF': {'vmin': -10, 'vmax': 70, 'cmap': 'HomeyerRainbow', 'title': 'Reflectivity (dBZ)'},
+    'corrected_reflectivity': {'vmin': -10, 'vmax': 70, 'cmap': 'HomeyerRainbow', 'title': 'Reflectivity (dBZ)'},
+
+    # Velocity
+    'velocity': {'vmin': -16, 'vmax': 16, 'cmap': 'PuOr_r', 'title': 'Radial Velocity (m/s)'},
+    'VEL': {'vmin': -16, 'vmax': 16, 'cmap': 'PuOr_r', 'title': 'Radial Velocity (m/s)'},
+    'FVEL': {'vmin': -16, 'vmax': 16, 'cmap': 'PuOr_r', 'title': 'Radial Velocity (m/s)'},
+
+    # Differential Reflectivity
+    'differential_reflectivity': {'vmin': -2, 'vmax': 6, 'cmap': 'ChaseSpectral', 'title': 'Differential Reflectivity (dB)'},
+    'ZDR': {'vmin': -2, 'vmax': 6, 'cmap': 'ChaseSpectral', 'title': 'Differential Reflectivity (dB)'},
+    'FZDR': {'vmin': -2, 'vmax': 6, 'cmap': 'ChaseSpectral', 'title': 'Differential Reflectivity (dB)'},
+    'corrected_zdr': {'vmin': -2, 'vmax': 6, 'cmap': 'ChaseSpectral', 'title': 'Differential Reflectivity (dB)'},
+
+    # Cross-correlation ratio
+    'cross_correlation_ratio': {'vmin': 0.4, 'vmax': 1.05, 'cmap': 'plasma', 'title': 'RHO (ρhv)'},
+    'RHO': {'vmin': 0.4, 'vmax': 1.05, 'cmap': 'plasma', 'title': 'RHO (ρhv)'},
+    'FRHO': {'vmin': 0.4, 'vmax': 1.05, 'cmap': 'plasma', 'title': 'RHO (ρhv)'},
+
+    # Spectrum width
+    'spectrum_width': {'vmin': 0, 'vmax': 10, 'cmap': 'pyart_NWS_SPW', 'title': 'Spectrum Width (m/s)'},
+    'SW': {'vmin': 0, 'vmax': 10, 'cmap': 'pyart_NWS_SPW', 'title': 'Spectrum Width (m/s)'},
+    'FSW': {'vmin': 0, 'vmax': 10, 'cmap': 'pyart_NWS_SPW', 'title': 'Spectrum Width (m/s)'},
+
+    # Differential phase
+    'differential_phase': {'vmin': 0, 'vmax': 180, 'cmap': 'viridis', 'title': 'Differential Phase (deg)'},
+    'PHI': {'vmin': 0, 'vmax': 180, 'cmap': 'viridis', 'title': 'Differential Phase (deg)'},
+    'FPHI': {'vmin': 0, 'vmax': 180, 'cmap': 'viridis', 'title': 'Differential Phase (deg)'},
+}
+
+# RHI plots use a tighter RHO range
+_RHI_FIELD_PARAMS = _FIELD_PARAMS_STATIC | {
+    'RHO': {'vmin': 0.6, 'vmax': 1.05, 'cmap': 'plasma', 'title': 'RHO (ρhv)'},
+    'FRHO': {'vmin': 0.6, 'vmax': 1.05, 'cmap': 'plasma', 'title': 'RHO (ρhv)'},
+}
+
+# Per-scan-type labels: the angle shown in each title and the axis labels
+_SCAN_KINDS = {
+    'rhi': {'angle': 'azimuth', 'angle_label': 'Az',
+            'xlabel': 'Distance from Radar (km)', 'ylabel': 'Height (km)'},
+    'ppi': {'angle': 'elevation', 'angle_label': 'El',
+            'xlabel': 'Distance from Radar (E/W) (km)', 'ylabel': 'Distance from Radar (N/S) (km)'},
+}
+
+# Resolution of saved figures; reusable canvases are created at this dpi
+_SAVE_DPI = 150
+
+# Colormap objects resolved from their names, shared across calls
+_CMAP_CACHE = {}
+
+# RGBA lookup tables baked from each colormap, keyed by colormap name
+_LUT_CACHE = {}
+
+# State for process-pool workers, set up once per worker by _init_sweep_worker
+_worker_state = {}
+
+
+def _get_cmap(name):
+    """
+    Return the Colormap registered under ``name``, resolving each name only once.
+    """
+    cmap = _CMAP_CACHE.get(name)
+    if cmap is None:
+        import matplotlib.pyplot as plt
+        import pyart  # noqa: F401 - registers the Py-ART colormaps with matplotlib
+        cmap = plt.get_cmap(name)
+        _CMAP_CACHE[name] = cmap
+    return cmap
+
+
+def _get_lut(name):
+    """
+    Return the (257, 4) uint8 lookup table for colormap ``name``, baking it only once.
+    """
+    lut = _LUT_CACHE.get(name)
+    if lut is None:
+        lut = build_lut(_get_cmap(name))
+        _LUT_CACHE[name] = lut
+    return lut
+
+
+@functools.lru_cache(maxsize=32)
+def _base_time(units_str):
+    """
+    Parse the reference time out of a CF time units string
+    (e.g. 'seconds since 2025-08-20T18:30:28Z').
+    """
+    base_time_str = units_str.split('since')[-1].strip().replace('Z', '')
+    return datetime.fromisoformat(base_time_str)
+
+
+def _new_figure(nplots):
+    """
+    Create a reusable (fig, axes, positions) canvas for saving to disk
+    without going through pyplot.
+
+    The figure gets a non-interactive Agg canvas no matter which backend is
+    active, so no GUI canvas is set up. These figures aren't tracked by
+    pyplot, so they can be built and drawn in worker threads and don't need
+    to be closed. They are created at the saved resolution, so a drawn canvas
+    is exactly the image that gets written.
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(figsize=(6 * nplots, 5), dpi=_SAVE_DPI)
+    FigureCanvasAgg(fig)
+    axes = np.atleast_1d(fig.subplots(1, nplots)).flatten()
+
+    # fixed margins (in inches, converted to figure fractions) set once, instead
+    # of re-running a layout solver for every sweep
+    width = 6 * nplots
+    fig.subplots_adjust(left=0.75 / width, right=1 - 0.6 / width, bottom=0.6 / 5, top=1 - 0.8 / 5, wspace=0.3)
+
+    positions = [ax.get_position() for ax in axes]
+    return fig, axes, positions
+
+
+def _reset_figure(fig, axes, positions):
+    """
+    Clear a reused figure so it can be drawn on again.
+
+    Removes the colorbar axes added for the previous sweep, clears the
+    plotting axes, and restores their original positions (colorbars shrink
+    the parent axes).
+    """
+    for extra_ax in [a for a in fig.axes if not any(a is ax for ax in axes)]:
+        extra_ax.remove()
+    for ax, pos in zip(axes, positions):
+        ax.clear()
+        ax.set_position(pos)
+
+
+def _apply_grid(ax):
+    # minor ticks with major and minor gridlines
+    ax.minorticks_on()
+    ax.grid(which='major', color='gray', linestyle='-', linewidth=0.8)
+    ax.grid(which='minor', color='gray', linestyle='--', linewidth=0.5)
+
+
+def _sweep_geometry(radar, kind, snum):
+    """
+    Compute the gate-edge mesh for one sweep, in km.
+
+    Matches the mesh Py-ART's RadarDisplay.plot_rhi/plot_ppi draw with their
+    defaults: antenna transition rays are dropped, and for RHIs the
+    horizontal coordinate is the ground distance signed by y (by x for
+    sweeps pointing east or west), flipped if the whole sweep lies on the
+    negative side.
+
+    Returns
+    -------
+    horiz, vert : ndarray
+        Mesh edge coordinates with shape (nrays + 1, ngates + 1).
+    rays : slice or ndarray
+        Ray indices into the radar volume covered by the sweep.
+    """
+    import pyart
+
+    start = radar.sweep_start_ray_index['data'][snum]
+    end = radar.sweep_end_ray_index['data'][snum] + 1
+    rays = slice(start, end)
+    if radar.antenna_transition is not None:
+        in_transition = radar.antenna_transition['data'][start:end] != 0
+        if in_transition.any():
+            rays = np.arange(start, end)[~in_transition]
+
+    x, y, z = pyart.core.antenna_vectors_to_cartesian(
+        radar.range['data'], radar.azimuth['data'][rays], radar.elevation['data'][rays], edges=True)
+
+    if kind == 'rhi':
+        # same azimuth ranges RadarDisplay.plot_rhi uses to sign by x
+        az_median = np.abs(np.median(radar.azimuth['data'][start:end]))
+        if (89.5 <= az_median <= 90.0) or (269.0 <= az_median <= 271.0):
+            side = np.sign(x)
+        else:
+            side = np.sign(y)
+        horiz = np.sqrt(x ** 2 + y ** 2) * side / 1000.0
+        if np.all(horiz < 1.0):
+            horiz = -horiz
+        return horiz, z / 1000.0, rays
+    return x / 1000.0, y / 1000.0, rays
+
+
+def _render_sweep(radar, fields_data, snum, job, canvas=None, writer=None):
+    """
+    Draw (and save) the figure for one sweep.
+
+    ``fields_data`` holds the float32 volume, from _fields_data, of each field
+    in ``job['resolved']``. ``job`` holds the per-call settings built by
+    plot_rhi/plot_ppi. ``canvas`` is a reusable (fig, axes, positions) tuple
+    from _new_figure for saving. With no canvas, a new pyplot figure is made
+    and left open for _render_sweeps to show.
+
+    When saving, the PNG is encoded and written on the ``writer`` executor if
+    one is given, and the Future for that write is returned; otherwise it is
+    written before returning.
+    """
+    from matplotlib.cm import ScalarMappable
+    from matplotlib.colors import Normalize
+
+    kind = job['kind']
+    labels = _SCAN_KINDS[kind]
+    xmin, xmax, ymin, ymax = job['limits']
+
+    # metadata for this sweep, precomputed by _sweep_metadata
+    angle, sweep_time, safe_time = job['sweep_meta'][int(snum)]
+
+    # plotting
+    if canvas is not None:
+        fig, axes, positions = canvas
+        _reset_figure(fig, axes, positions)
+    else:
+        import matplotlib.pyplot as plt
+        fig, axes = plt.subplots(1, len(job['resolved']), figsize=(6 * len(job['resolved']), 5),
+                                 layout='constrained')
+        axes = np.atleast_1d(axes).flatten()
+
+    # gate mesh for this sweep, shared by all fields
+    horiz, vert, rays = _sweep_geometry(radar, kind, snum)
+
+    for ax, data, (field, vmin, vmax, cmap, lut, title) in zip(axes, fields_data, job['resolved']):
+
+        # color the gates ourselves and hand pcolormesh an RGBA array, which
+        # skips matplotlib's normalize + colormap pass
+        rgba = rescale_and_lookup(data[rays], vmin, vmax, lut)
+        ax.pcolormesh(horiz, vert, rgba, shading='flat')
+        # position-based colorbar, so it is carved from the axes position restored by _reset_figure
+        fig.colorbar(ScalarMappable(norm=Normalize(vmin=vmin, vmax=vmax), cmap=cmap), ax=ax, label=title,
+                     use_gridspec=False)
+        ax.set_title(f"ARMOR {kind.upper()} | {title}  \n  {labels['angle_label']}: {angle:.1f}°  |  {sweep_time}")
+        ax.set_xlim(xmin, xmax)
+        ax.set_ylim(ymin, ymax)
+        ax.set_xlabel(labels['xlabel'])
+        ax.set_ylabel(labels['ylabel'])
+
+        # Turn on major and minor ticks if True
+        if job['grids']:
+            _apply_grid(ax)
+
+    # if save path is specified, saves the figure; otherwise it stays open to be shown
+    if job['save_path']:
+        out_path = f"{job['save_prefix']}ARMR_{kind.upper()}_{safe_time}.png"
+        fig.canvas.draw()
+        # copy the pixels out, since the canvas is redrawn for the next sweep
+        rgba = np.array(fig.canvas.buffer_rgba())
+        if writer is not None:
+            return writer.submit(_write_png, rgba, out_path, job['png_compress_level'])
+        _write_png(rgba, out_path, job['png_compress_level'])
+    return None
+
+
+def _write_png(rgba, out_path, compress_level):
+    # same file savefig writes for the whole canvas; PIL's zlib deflate releases the GIL
+    from matplotlib.image import imsave
+    imsave(out_path, rgba, format='png', dpi=_SAVE_DPI,
+           pil_kwargs={"compress_level": compress_level, "optimize": False})
+
+
+def _sweep_metadata(radar, sweeps, kind, base_time):
+    """
+    Gather the title angle, ISO time string and filename-safe time string for
+    every sweep in one pass, keyed by sweep number.
+    """
+    sweeps = np.asarray(sweeps, dtype=int)
+    starts = radar.sweep_start_ray_index['data'][sweeps]
+    angles = getattr(radar, _SCAN_KINDS[kind]['angle'])['data'][starts]
+    seconds = np.round(radar.time['data'][starts]).astype(np.int64)
+
+    meta = {}
+    for snum, angle, secs in zip(sweeps.tolist(), angles.tolist(), seconds.tolist()):
+        sweep_datetime = base_time + timedelta(seconds=secs)
+        meta[snum] = (angle, f"{sweep_datetime.isoformat()}Z", sweep_datetime.strftime("%Y%m%d%H%M%S"))
+    return meta
+
+
+def _fields_data(radar, job):
+    """
+    Copy each field in ``job['resolved']`` into one float32 volume with NaN
+    at masked gates.
+
+    Done once per call, so sweeps slice these buffers instead of
+    allocating masked-array temporaries for every sweep and field.
+    """
+    fields_data = []
+    for field, *_ in job['resolved']:
+        data = radar.fields[field]['data']
+        buf = np.empty(data.shape, dtype=np.float32)
+        np.copyto(buf, np.ma.getdata(data), casting='unsafe')
+        mask = np.ma.getmask(data)
+        if mask is not np.ma.nomask:
+            buf[mask] = np.nan
+        fields_data.append(buf)
+    return fields_data
+
+
+def _init_sweep_worker(radar, fields_data, job):
+    # runs once in each worker process; arguments arrive by fork (or pickle under spawn)
+    _worker_state['radar'] = radar
+    _worker_state['fields_data'] = fields_data
+    _worker_state['job'] = job
+    _worker_state['canvas'] = None
+
+
+def _render_sweep_in_worker(snum):
+    # each worker process reuses one figure for all the sweeps it renders
+    if _worker_state['canvas'] is None:
+        _worker_state['canvas'] = _new_figure(len(_worker_state['job']['resolved']))
+    _render_sweep(_worker_state['radar'], _worker_state['fields_data'], snum,
+                  _worker_state['job'], _worker_state['canvas'])
+
+
+def _render_sweeps(radar, sweeps, job, parallel):
+    """
+    Render every sweep, optionally in parallel when saving to disk.
+
+    Sweeps are independent, so saved figures can go to a thread pool
+    (``parallel='thread'``) or a process pool (``parallel='process'``).
+    Interactive display, single sweeps and ``parallel=None`` run serially;
+    displayed figures are all built first and then shown together. When
+    saving serially, each PNG is encoded on a background thread while the
+    next sweep draws.
+    """
+    if parallel not in ('thread', 'process', None):
+        raise ValueError(f"parallel must be 'thread', 'process' or None, not {parallel!r}")
+
+    nplots = len(job['resolved'])
+    job['sweep_meta'] = _sweep_metadata(radar, sweeps, job['kind'], job['base_time'])
+    fields_data = _fields_data(radar, job)
+
+    if not job['save_path']:
+        for snum in sweeps:
+            _render_sweep(radar, fields_data, snum, job)
+        # one show() for every figure, rather than blocking once per sweep
+        import matplotlib.pyplot as plt
+        plt.show()
+        return
+
+    # create the output directory once and build file names by string concatenation
+    Path(job['save_path']).mkdir(parents=True, exist_ok=True)
+    job['save_prefix'] = os.path.join(os.fspath(job['save_path']), '')
+
+    if parallel == 'process' and len(sweeps) > 1:
+        with ProcessPoolExecutor(max_workers=min(len(sweeps), os.cpu_count() or 1),
+                                 initializer=_init_sweep_worker, initargs=(radar, fields_data, job)) as executor:
+            list(executor.map(_render_sweep_in_worker, sweeps))
+        return
+
+    if parallel == 'thread' and len(sweeps) > 1:
+        # each thread reuses one figure for all the sweeps it renders, and writes
+        # its own PNGs since their encodes already overlap other threads' drawing
+        local = threading.local()
+
+        def _render(snum):
+            if not hasattr(local, 'canvas'):
+                local.canvas = _new_figure(nplots)
+            _render_sweep(radar, fields_data, snum, job, local.canvas)
+
+        with ThreadPoolExecutor(max_workers=min(4, len(sweeps))) as executor:
+            list(executor.map(_render, sweeps))
+        return
+
+    # serially, hand each PNG to one writer thread and draw the next sweep meanwhile
+    canvas = _new_figure(nplots)
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        writes = [_render_sweep(radar, fields_data, snum, job, canvas, writer) for snum in sweeps]
+    for write in writes:
+        write.result()
+
+
+def plot_rhi(radar, fields, xmin = 0, xmax = 60, ymin = 0, ymax = 12, save_path = None, grids = False, field_params = None, png_compress_level = 1, parallel = None):
     """
     Generate Range–Height Indicator (RHI) plots for one or more radar fields.
 
@@ -26,10 +404,23 @@ def plot_rhi(radar, fields, xmin = 0, xmax = 60, ymin = 0, ymax = 12, save_path
     ymin, ymax : float, optional
         Vertical range limits in km. Defaults to 0–12 km.
     save_path : str or Path, optional
-        Directory where output figures will be written. If None, figures display
-        instead of saving.
+        Directory where output figures will be written (created if needed). If
+        None, the figures for all sweeps are shown together instead of saving.
     grids : bool, optional
         If True, enables major and minor gridlines on each subplot.
+    field_params : dict, optional
+        Mapping of field name to {'vmin', 'vmax', 'cmap', 'title'} that
+        overrides or extends the default plotting parameters.
+    png_compress_level : int, optional
+        zlib compression level (0-9) for saved PNGs. Lower is faster but gives
+        larger files. Defaults to 1.
+    parallel : {'thread', 'process', None}, optional
+        How saved sweeps are rendered: serially with None (default, which
+        still encodes each PNG in the background while the next sweep draws),
+        in a process pool (faster for many sweeps, but each worker gets a copy
+        of the radar), or in a thread pool. Matplotlib is not documented as
+        thread-safe, so 'thread' is opt-in. Displayed figures are always drawn
+        serially.
 
     Returns
     -------
@@ -37,110 +428,32 @@ def plot_rhi(radar, fields, xmin = 0, xmax = 60, ymin = 0, ymax = 12, save_path
         Displays or saves RHI figures for each sweep.
     """
 
-    # Creates display object
-    display = pyart.graph.RadarDisplay(radar)
-    vnyq = radar.instrument_parameters['nyquist_velocity']['data'][0]
     sweeps = radar.sweep_number['data']
 
-    # Dictionary of plotting parameters for each field
-    FIELD_PARAMS = {
-        # Reflectivity
-        'reflectivity': {'vmin': -10, 'vmax': 70, 'cmap': 'HomeyerRainbow', 'title': 'Reflectivity (dBZ)'},
-        'REF': {'vmin': -10, 'vmax': 70, 'cmap': 'HomeyerRainbow', 'title': 'Reflectivity (dBZ)'},
-        'FREF': {'vmin': -10, 'vmax': 70, 'cmap': 'HomeyerRainbow', 'title': 'Reflectivity (dBZ)'},
-        'corrected_reflectivity': {'vmin': -10, 'vmax': 70, 'cmap': 'HomeyerRainbow', 'title': 'Reflectivity (dBZ)'},
-
-        # Velocity
-        'velocity': {'vmin': -16, 'vmax': 16, 'cmap': 'PuOr_r', 'title': 'Radial Velocity (m/s)'},
-        'VEL': {'vmin': -16, 'vmax': 16, 'cmap': 'PuOr_r', 'title': 'Radial Velocity (m/s)'},
-        'FVEL': {'vmin': -16, 'vmax': 16, 'cmap': 'PuOr_r', 'title': 'Radial Velocity (m/s)'},
-
-        # Differential Reflectivity
-        'differential_reflectivity': {'vmin': -2, 'vmax': 6, 'cmap': 'ChaseSpectral', 'title': 'Differential Reflectivity (dB)'},
-        'ZDR': {'vmin': -2, 'vmax': 6, 'cmap': 'ChaseSpectral', 'title': 'Differential Reflectivity (dB)'},
-        'FZDR': {'vmin': -2, 'vmax': 6, 'cmap': 'ChaseSpectral', 'title': 'Differential Reflectivity (dB)'},
-        'corrected_zdr': {'vmin': -2, 'vmax': 6, 'cmap': 'ChaseSpectral', 'title': 'Differential Reflectivity (dB)'},
-
-        # Cross-correlation ratio
-        'cross_correlation_ratio': {'vmin': 0.4, 'vmax': 1.05, 'cmap': 'plasma', 'title': 'RHO (ρhv)'},
-        'RHO': {'vmin': 0.6, 'vmax': 1.05, 'cmap': 'plasma', 'title': 'RHO (ρhv)'},
-        'FRHO': {'vmin': 0.6, 'vmax': 1.05, 'cmap': 'plasma', 'title': 'RHO (ρhv)'},
-
-        # Spectrum width
-        'spectrum_width': {'vmin': 0, 'vmax': 10, 'cmap': 'pyart_NWS_SPW', 'title': 'Spectrum Width (m/s)'},
-        'SW': {'vmin': 0, 'vmax': 10, 'cmap': 'pyart_NWS_SPW', 'title': 'Spectrum Width (m/s)'},
-        'FSW': {'vmin': 0, 'vmax': 10, 'cmap': 'pyart_NWS_SPW', 'title': 'Spectrum Width (m/s)'},
-
-        # Differential phase
-        'differential_phase': {'vmin': 0, 'vmax': 180, 'cmap': 'viridis', 'title': 'Differential Phase (deg)'},
-        'PHI': {'vmin': 0, 'vmax': 180, 'cmap': 'viridis', 'title': 'Differential Phase (deg)'},
-        'FPHI': {'vmin': 0, 'vmax': 180, 'cmap': 'viridis', 'title': 'Differential Phase (deg)'},
-
+    # Plotting parameters for each field, with any user overrides
+    FIELD_PARAMS = _RHI_FIELD_PARAMS if field_params is None else _RHI_FIELD_PARAMS | field_params
+
+    # Resolve each field's parameters once (raises KeyError early for unknown fields)
+    resolved = []
+    for field in fields:
+        params = FIELD_PARAMS[field]
+        resolved.append((field, params['vmin'], params['vmax'], _get_cmap(params['cmap']),
+                         _get_lut(params['cmap']), params['title']))
+
+    job = {
+        'kind': 'rhi',
+        'resolved': resolved,
+        'base_time': _base_time(radar.time['units']),
+        'limits': (xmin, xmax, ymin, ymax),
+        'grids': grids,
+        'save_path': save_path,
+        'png_compress_level': png_compress_level,
     }
 
-    # Extract base time string
-    units_str = radar.time['units']
-    base_time_str = units_str.split('since')[-1].strip().replace('Z', '')
-    base_time = datetime.fromisoformat(base_time_str)
-
-    for snum in sweeps:
-        # getting metadata for each sweep
-        sweep_starts = radar.sweep_start_ray_index['data'][snum]
-        sweep_ends = radar.sweep_end_ray_index['data'][snum]
-        azimuth = radar.azimuth['data'][sweep_starts]
-        sweep_time_seconds = round(radar.time['data'][sweep_starts])
-        sweep_datetime = base_time + timedelta(seconds=float(sweep_time_seconds))
-        sweep_time = f"{sweep_datetime.isoformat()}Z"
-
-
-        # plotting
-        nplots = len(fields)
-        fig, axes = plt.subplots(1, nplots, figsize=(6 * nplots, 5))
-        axes = np.atleast_1d(axes).flatten()
-
-        for i, field in enumerate(fields):
-
-            params = FIELD_PARAMS[field]
-            ax = axes[i]
-
-            display.plot_rhi(
-                field, sweep=snum, ax=ax,
-                vmin=params['vmin'], vmax=params['vmax'],
-                cmap=params['cmap'],
-                colorbar_label=params['title'],
-                title=f"ARMOR RHI | {params['title']}  \n  Az: {azimuth:.1f}°  |  {sweep_time}"
-            )
-            ax.set_xlim(xmin, xmax)
-            ax.set_ylim(ymin, ymax)
-            ax.set_xlabel('Distance from Radar (km)')
-            ax.set_ylabel('Height (km)')
-
-            # Turn on major and minor ticks if True
-            if grids == True:
-                ax.minorticks_on()
-                # Major gridlines
-                ax.grid(which='major', color='gray', linestyle='-', linewidth=0.8)
-                # Minor gridlines
-                ax.grid(which='minor', color='gray', linestyle='--', linewidth=0.5)
-
-        plt.tight_layout()
-        # getting rid of "bad" filename characters for time string
-        safe_time = (
-            sweep_time.replace(":", "")
-            .replace("T", "")
-            .replace("Z", "")
-        )
-
-        # if save path is specified, saves the figure, if not then displays the figure
-        if save_path:
-            out_path = Path(save_path) / f"ARMR_RHI_{safe_time}.png"
-            plt.savefig(out_path, dpi=150)
-            plt.close(fig)
-        else:
-            plt.show()
+    _render_sweeps(radar, sweeps, job, parallel)
 
 
-def plot_ppi(radar, fields, sweeps = False, xmin=-60, xmax=60, ymin=-60, ymax = 60, save_path = None, grids = False):
+def plot_ppi(radar, fields, sweeps = False, xmin=-60, xmax=60, ymin=-60, ymax = 60, save_path = None, grids = False, field_params = None, png_compress_level = 1, parallel = None):
     """
         Generate Plan Position Indicator (PPI) plots for one or more radar fields.
 
@@ -156,124 +469,57 @@ def plot_ppi(radar, fields, sweeps = False, xmin=-60, xmax=60, ymin=-60, ymax =
         fields : list of str
             Names of fields to plot (e.g., ['reflectivity', 'velocity']).
         sweeps : list of int or bool, optional
-            Sweep numbers to plot. If False (default), all sweeps available in the
-            radar file are plotted.
+            Sweep numbers to plot. If False (default) or None, all sweeps available
+            in the radar file are plotted.
         xmin, xmax : float, optional
             Horizontal plot extent in km (east–west). Defaults to –60 to 60 km.
         ymin, ymax : float, optional
             Vertical plot extent in km (north–south). Defaults to –60 to 60 km.
         save_path : str or Path, optional
-            Directory where output figures will be written. If None, figures display
-            instead of saving.
+            Directory where output figures will be written (created if needed). If
+            None, the figures for all sweeps are shown together instead of saving.
         grids : bool, optional
             If True, enables major and minor gridlines on each subplot.
+        field_params : dict, optional
+            Mapping of field name to {'vmin', 'vmax', 'cmap', 'title'} that
+            overrides or extends the default plotting parameters.
+        png_compress_level : int, optional
+            zlib compression level (0-9) for saved PNGs. Lower is faster but gives
+            larger files. Defaults to 1.
+        parallel : {'thread', 'process', None}, optional
+            How saved sweeps are rendered: serially with None (default, which
+            still encodes each PNG in the background while the next sweep draws),
+            in a process pool (faster for many sweeps, but each worker gets a copy
+            of the radar), or in a thread pool. Matplotlib is not documented as
+            thread-safe, so 'thread' is opt-in. Displayed figures are always drawn
+            serially.
 
         Returns
         -------
         None
             Displays or saves PPI figures for each sweep.
         """
-    # Creates display object
-    display = pyart.graph.RadarDisplay(radar)
-    vnyq = radar.instrument_parameters['nyquist_velocity']['data'][0]
-
-    if sweeps == False:
+    if sweeps is False or sweeps is None:
         sweeps = radar.sweep_number['data']
-    else:
-        sweeps = sweeps
-
-    # Dictionary of plotting parameters for each field
-    FIELD_PARAMS = {
-        # Reflectivity
-        'reflectivity': {'vmin': -10, 'vmax': 70, 'cmap': 'HomeyerRainbow', 'title': 'Reflectivity (dBZ)'},
-        'REF': {'vmin': -10, 'vmax': 70, 'cmap': 'HomeyerRainbow', 'title': 'Reflectivity (dBZ)'},
-        'FREF': {'vmin': -10, 'vmax': 70, 'cmap': 'HomeyerRainbow', 'title': 'Reflectivity (dBZ)'},
-        'corrected_reflectivity': {'vmin': -10, 'vmax': 70, 'cmap': 'HomeyerRainbow', 'title': 'Reflectivity (dBZ)'},
-
-        # Velocity
-        'velocity': {'vmin': -16, 'vmax': 16, 'cmap': 'PuOr_r', 'title': 'Radial Velocity (m/s)'},
-        'VEL': {'vmin': -16, 'vmax': 16, 'cmap': 'PuOr_r', 'title': 'Radial Velocity (m/s)'},
-        'FVEL': {'vmin': -16, 'vmax': 16, 'cmap': 'PuOr_r', 'title': 'Radial Velocity (m/s)'},
-
-        # Differential Reflectivity
-        'differential_reflectivity': {'vmin': -2, 'vmax': 6, 'cmap': 'ChaseSpectral', 'title': 'Differential Reflectivity (dB)'},
-        'ZDR': {'vmin': -2, 'vmax': 6, 'cmap': 'ChaseSpectral', 'title': 'Differential Reflectivity (dB)'},
-        'FZDR': {'vmin': -2, 'vmax': 6, 'cmap': 'ChaseSpectral', 'title': 'Differential Reflectivity (dB)'},
-        'corrected_zdr': {'vmin': -2, 'vmax': 6, 'cmap': 'ChaseSpectral', 'title': 'Differential Reflectivity (dB)'},
-
-        # Cross-correlation ratio
-        'cross_correlation_ratio': {'vmin': 0.4, 'vmax': 1.05, 'cmap': 'plasma', 'title': 'RHO (ρhv)'},
-        'RHO': {'vmin': 0.4, 'vmax': 1.05, 'cmap': 'plasma', 'title': 'RHO (ρhv)'},
-        'FRHO': {'vmin': 0.4, 'vmax': 1.05, 'cmap': 'plasma', 'title': 'RHO (ρhv)'},
-
-        # Spectrum width
-        'spectrum_width': {'vmin': 0, 'vmax': 10, 'cmap': 'pyart_NWS_SPW', 'title': 'Spectrum Width (m/s)'},
-        'SW': {'vmin': 0, 'vmax': 10, 'cmap': 'pyart_NWS_SPW', 'title': 'Spectrum Width (m/s)'},
-        'FSW': {'vmin': 0, 'vmax': 10, 'cmap': 'pyart_NWS_SPW', 'title': 'Spectrum Width (m/s)'},
-
-        # Differential phase
-        'differential_phase': {'vmin': 0, 'vmax': 180, 'cmap': 'viridis', 'title': 'Differential Phase (deg)'},
-        'PHI': {'vmin': 0, 'vmax': 180, 'cmap': 'viridis', 'title': 'Differential Phase (deg)'},
-        'FPHI': {'vmin': 0, 'vmax': 180, 'cmap': 'viridis', 'title': 'Differential Phase (deg)'},
-    }
-
-    # Extract base time string
-    units_str = radar.time['units']
-    base_time_str = units_str.split('since')[-1].strip().replace('Z', '')
-    base_time = datetime.fromisoformat(base_time_str)
 
-    for snum in sweeps:
-        # getting metadata for each sweep
-        sweep_starts = radar.sweep_start_ray_index['data'][snum]
-        sweep_ends = radar.sweep_end_ray_index['data'][snum]
-        elevation = radar.elevation['data'][sweep_starts]
-        sweep_time_seconds = round(radar.time['data'][sweep_starts])
-        sweep_datetime = base_time + timedelta(seconds=float(sweep_time_seconds))
-        sweep_time = f"{sweep_datetime.isoformat()}Z"
-
-
-        # plotting
-        nplots = len(fields)
-        fig, axes = plt.subplots(1, nplots, figsize=(6 * nplots, 5))
-        axes = np.atleast_1d(axes).flatten()
+    # Plotting parameters for each field, with any user overrides
+    FIELD_PARAMS = _FIELD_PARAMS_STATIC if field_params is None else _FIELD_PARAMS_STATIC | field_params
+
+    # Resolve each field's parameters once (raises KeyError early for unknown fields)
+    resolved = []
+    for field in fields:
+        params = FIELD_PARAMS[field]
+        resolved.append((field, params['vmin'], params['vmax'], _get_cmap(params['cmap']),
+                         _get_lut(params['cmap']), params['title']))
+
+    job = {
+        'kind': 'ppi',
+        'resolved': resolved,
+        'base_time': _base_time(radar.time['units']),
+        'limits': (xmin, xmax, ymin, ymax),
+        'grids': grids,
+        'save_path': save_path,
+        'png_compress_level': png_compress_level,
+    }
 
-        for i, field in enumerate(fields):
-
-            params = FIELD_PARAMS[field]
-            ax = axes[i]
-
-            display.plot_ppi(
-                field, sweep=snum, ax=ax,
-                vmin=params['vmin'], vmax=params['vmax'],
-                cmap=params['cmap'],
-                colorbar_label=params['title'],
-                title=f"ARMOR PPI | {params['title']}  \n  El: {elevation:.1f}°  |  {sweep_time}"
-            )
-            ax.set_xlim(xmin, xmax)
-            ax.set_ylim(ymin, ymax)
-            ax.set_xlabel('Distance from Radar (E/W) (km)')
-            ax.set_ylabel('Distance from Radar (N/S) (km)')
-
-            # Turn on major and minor ticks if True
-            if grids == True:
-                ax.minorticks_on()
-                # Major gridlines
-                ax.grid(which='major', color='gray', linestyle='-', linewidth=0.8)
-                # Minor gridlines
-                ax.grid(which='minor', color='gray', linestyle='--', linewidth=0.5)
-
-        plt.tight_layout()
-        # getting rid of "bad" filename characters for time string
-        safe_time = (
-            sweep_time.replace(":", "")
-            .replace("T", "")
-            .replace("Z", "")
-        )
-
-        # if save path is specified, saves the figure, if not then displays the figure
-        if save_path:
-            out_path = Path(save_path) / f"ARMR_PPI_{safe_time}.png"
-            plt.savefig(out_path, dpi=150)
-            plt.close(fig)
-        else:
-            plt.show()
\ No newline at end of file
+    _render_sweeps(radar, sweeps, job, parallel)
@@ -1,15 +1,25 @@
-from setuptools import setup, find_packages
+from setuptools import setup
 from pathlib import Path
+import sys
 
-# Read requirements from requirements.txt
-requirements_path = Path(__file__).parent / "requirements.txt"
-with open(requirements_path) as f:
-    requirements = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+# Package metadata and dependencies live in pyproject.toml; setup.py only adds
+# the optional compiled colormap kernel.
 
-setup(
-    name="armor_tools",
-    version="0.1",
-    packages=find_packages(),
-    install_requires=requirements,
-    python_requires=">=3.10",
-)
+# Compile the colormap lookup kernel ahead of time when numba is available,
+# so it doesn't need a JIT compile on first use
+ext_modules = []
+sys.path.insert(0, str(Path(__file__).parent))
+try:
+    from armor_tools._colormap_numba import aot_compiler
+    cc = aot_compiler()
+except ImportError:
+    # numba isn't installed
+    cc = None
+except RuntimeError:
+    # numba found no C compiler
+    cc = None
+if cc is not None:
+    # optional, so a failing compile falls back to the JIT/numpy kernel
+    ext_modules.append(cc.distutils_extension(optional=True))
+
+setup(ext_modules=ext_modules)
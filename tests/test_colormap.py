@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+matplotlib = pytest.importorskip("matplotlib")
+from matplotlib.colors import Normalize
+
+from armor_tools import _colormap_numba
+
+
+def _kernels():
+    kernels = [
+        _colormap_numba.rescale_and_lookup,
+        lambda data, vmin, vmax, lut: _colormap_numba._lookup_numpy(
+            np.asarray(data, dtype=np.float32), vmin, vmax, lut,
+            np.empty(data.shape + (4,), dtype=np.uint8)),
+    ]
+    ids = ["rescale_and_lookup", "numpy"]
+    return pytest.mark.parametrize("lookup", kernels, ids=ids)
+
+
+def _expected(cmap, data, vmin, vmax):
+    # plot.py passes NaN for masked gates; mask only those, so +/-inf still
+    # map through Normalize to the over/under colors
+    data = np.asarray(data, dtype=np.float32).astype(np.float64)
+    masked = np.ma.masked_where(np.isnan(data), data)
+    return cmap(Normalize(vmin, vmax)(masked), bytes=True)
+
+
+def _field():
+    rng = np.random.default_rng(0)
+    data = rng.uniform(-20.0, 80.0, size=(40, 50)).astype(np.float32)
+    data[0, :4] = [np.nan, np.inf, -np.inf, np.nan]
+    # exactly at and just outside the limits
+    data[1, :4] = [-10.0, 70.0, -10.5, 70.5]
+    return data
+
+
+@_kernels()
+@pytest.mark.parametrize("name", ["viridis", "jet"])
+def test_lookup_matches_matplotlib(lookup, name):
+    cmap = matplotlib.colormaps[name]
+    lut = _colormap_numba.build_lut(cmap)
+    data = _field()
+    np.testing.assert_array_equal(
+        lookup(data, -10.0, 70.0, lut), _expected(cmap, data, -10.0, 70.0))
+
+
+@_kernels()
+def test_lookup_vmin_equals_vmax(lookup):
+    cmap = matplotlib.colormaps["viridis"]
+    lut = _colormap_numba.build_lut(cmap)
+    data = _field()
+    np.testing.assert_array_equal(
+        lookup(data, 5.0, 5.0, lut), _expected(cmap, data, 5.0, 5.0))
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+pyart = pytest.importorskip("pyart")
+
+from matplotlib.figure import Figure
+
+from armor_tools import plot
+
+
+def _rhi_radar(azimuth):
+    radar = pyart.testing.make_empty_rhi_radar(50, 40, 2)
+    radar.azimuth['data'][:] = azimuth
+    radar.add_field('REF', {'data': np.ma.zeros((radar.nrays, radar.ngates))})
+    return radar
+
+
+@pytest.mark.parametrize("azimuth", [
+    np.tile([89.95, 90.05], 40),   # east, straddling 90 degrees
+    np.full(80, 270.2),            # west
+    np.full(80, 10.0),             # north
+    np.full(80, 185.0),            # south
+])
+def test_rhi_geometry_matches_radardisplay(azimuth):
+    radar = _rhi_radar(azimuth)
+    display = pyart.graph.RadarDisplay(radar)
+    for snum in range(radar.nsweeps):
+        ax = Figure().subplots()
+        display.plot_rhi('REF', snum, ax=ax, colorbar_flag=False)
+        expected = display.plots[-1].get_coordinates()
+
+        horiz, vert, rays = plot._sweep_geometry(radar, 'rhi', snum)
+        np.testing.assert_allclose(horiz, expected[..., 0], atol=1e-6)
+        np.testing.assert_allclose(vert, expected[..., 1], atol=1e-6)
+        _, z = display._get_x_z(snum, True, True)
+        np.testing.assert_allclose(vert, z)
+
+
+def test_ppi_geometry_matches_radardisplay():
+    radar = pyart.testing.make_empty_ppi_radar(50, 36, 2)
+    radar.antenna_transition = {'data': np.zeros(radar.nrays, dtype=int)}
+    radar.antenna_transition['data'][[0, 40]] = 1
+    display = pyart.graph.RadarDisplay(radar)
+    for snum in range(radar.nsweeps):
+        horiz, vert, rays = plot._sweep_geometry(radar, 'ppi', snum)
+        x, y = display._get_x_y(snum, True, True)
+        np.testing.assert_allclose(horiz, x)
+        np.testing.assert_allclose(vert, y)
+        assert len(np.arange(radar.nrays)[rays]) == 35
@@ -0,0 +1,76 @@
+import lzma
+
+import numpy as np
+import pytest
+
+from armor_tools import analysis
+
+netCDF4 = pytest.importorskip("netCDF4")
+
+
+def _write_xz(path, vcp, nvalues, nc_format="NETCDF3_64BIT"):
+    # a large field stored before vcp_pattern, so the VCP value lies past the
+    # partial header read
+    nc_path = path.with_suffix("")
+    with netCDF4.Dataset(nc_path, "w", format=nc_format) as ds:
+        ds.createDimension("n", nvalues)
+        ds.createVariable("field", "f4", ("n",))[:] = np.zeros(nvalues, dtype=np.float32)
+        ds.createVariable("vcp_pattern", "i4").assignValue(vcp)
+    path.write_bytes(lzma.compress(nc_path.read_bytes(), preset=0))
+    nc_path.unlink()
+    return path
+
+
+@pytest.fixture
+def vcp_folder(tmp_path):
+    nvalues = analysis.HEADER_READ_SIZE  # field alone is 4x the partial read
+    _write_xz(tmp_path / "a.nc.xz", 212, nvalues)
+    _write_xz(tmp_path / "b.nc.xz", 32, nvalues)
+    _write_xz(tmp_path / "c.nc.xz", 12, 10)
+    return tmp_path
+
+
+def test_vcp_past_partial_read(vcp_folder):
+    assert analysis._vcp_for_file(vcp_folder / "a.nc.xz") == (vcp_folder / "a.nc.xz", 212)
+
+
+@pytest.mark.parametrize("nvalues, streamed", [(10, False), (analysis.HEADER_READ_SIZE, True)])
+def test_vcp_netcdf4(tmp_path, monkeypatch, nvalues, streamed):
+    # HDF5 buffers can't be opened truncated, so large files go through a temp
+    # file rather than being decompressed whole into memory
+    path = _write_xz(tmp_path / "d.nc.xz", 215, nvalues, nc_format="NETCDF4")
+    temp_files = []
+    decompressed_xz = analysis._decompressed_xz
+
+    def spy(*args, **kwargs):
+        temp_files.append(args[0])
+        return decompressed_xz(*args, **kwargs)
+
+    monkeypatch.setattr(analysis, "_decompressed_xz", spy)
+    assert analysis._vcp_for_file(path) == (path, 215)
+    assert bool(temp_files) == streamed
+    assert analysis.filter_files_vcp([path], 200, 300) == [path]
+
+
+def test_filter_folder_vcp(vcp_folder):
+    kept = analysis.filter_folder_vcp(vcp_folder, 200, 300, max_workers=2)
+    assert kept == [vcp_folder / "a.nc.xz"]
+
+
+def test_filter_files_vcp(vcp_folder):
+    files = sorted(vcp_folder.glob("*.xz"))
+    kept = analysis.filter_files_vcp(files, 0, 100)
+    assert sorted(kept) == [vcp_folder / "b.nc.xz", vcp_folder / "c.nc.xz"]
+
+
+def test_filter_folder_vcp_empty(tmp_path):
+    assert analysis.filter_folder_vcp(tmp_path, 0, 300) == []
+
+
+def test_filter_folder_vcp_in_process(vcp_folder, monkeypatch):
+    # one worker must not start a process pool
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool started")
+
+    monkeypatch.setattr(analysis, "ProcessPoolExecutor", no_pool)
+    assert analysis.filter_folder_vcp(vcp_folder, 200, 300, max_workers=1) == [vcp_folder / "a.nc.xz"]